@@ -20,18 +20,57 @@ Project code is read from .claude/project-code.txt in the session's working
 directory. Falls back to the directory name if the file doesn't exist.
 
 Output: one appended row in sessions.csv per session.
+
+The hook itself returns as soon as the payload is read: the transcript scan,
+CSV append, registry update, and dashboard push run in a detached worker
+(a forked child on POSIX, `log_session.py --worker` on Windows). The
+worker's stderr, including the traceback of any session it failed to log,
+is appended to log_session_errors.log next to sessions.csv.
 """
 from __future__ import annotations
 
 import csv
+import itertools
 import json
+import mmap
 import os
+import subprocess
 import sys
+import traceback
 from datetime import datetime, timezone
+from io import BytesIO, StringIO
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    orjson = None
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; only used when orjson is missing
+    ijson = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX — O_APPEND alone keeps each append atomic
+    msvcrt = None
+
 LOG_FILE = Path("C:/Users/Tracy/Projects/claude-tracking/sessions.csv")
 REGISTRY_FILE = Path("C:/Users/Tracy/Projects/claude-tracking/projects.json")
+STATE_FILE = Path("C:/Users/Tracy/Projects/claude-tracking/transcript_state.json")
+# stderr of the detached worker; a session that failed to log leaves its traceback here
+ERROR_LOG = Path("C:/Users/Tracy/Projects/claude-tracking/log_session_errors.log")
+
+# Sessions remembered in STATE_FILE; older ones are re-read in full if resumed
+_STATE_MAX_SESSIONS = 200
+
+# Byte locked (far past EOF) to serialize concurrent appends on Windows
+_LOCK_OFFSET = 2**31 - 2
 
 FIELDNAMES = [
     "date",
@@ -51,25 +90,144 @@ def get_project_code(cwd: str) -> str:
     Return the project code for billing attribution.
 
     Reads from .claude/project-code.txt in the session's working directory.
-    Falls back to the directory name if the file doesn't exist — this ensures
-    every session is attributed to something, even for projects that haven't
-    been set up with an explicit code yet.
+    Falls back to the directory name if the file can't be read (missing, or
+    .claude isn't a directory) — this ensures every session is attributed
+    to something, even for projects that haven't been set up with an
+    explicit code yet.
+    """
+    project_dir = Path(cwd)
+    try:
+        code = (project_dir / ".claude" / "project-code.txt").read_text(encoding="utf-8")
+    except OSError:
+        return project_dir.name
+    return code.strip() or project_dir.name
+
+
+def _add_usage(obj: object, totals: dict) -> None:
+    """Add the `message.usage` token counts of one decoded record to totals."""
+    msg = obj.get("message", {}) if isinstance(obj, dict) else None
+    if not isinstance(msg, dict):
+        return
+    usage = msg.get("usage", {})
+    if not usage:
+        return
+    for key in totals:
+        totals[key] += usage.get(key, 0)
+
+
+def _accumulate_usage(line: bytes, totals: dict) -> None:
+    """
+    Add the `message.usage` token counts from one transcript line to totals.
+
+    Lines are decoded whole with orjson when it is installed — it beats an
+    ijson event pass several times over, even though the latter builds only
+    the usage object. Without orjson, ijson (if present) is used so content
+    blocks and tool output are scanned past rather than decoded by the
+    stdlib parser. Malformed lines are skipped without touching totals.
+    """
+    # Most lines (user turns, tool results) carry no usage at all
+    if b'"usage"' not in line:
+        return
+
+    if orjson is not None or ijson is None:
+        try:
+            obj = _loads(line)
+        except (_JSONDecodeError, UnicodeDecodeError):
+            return
+        _add_usage(obj, totals)
+        return
+
+    try:
+        found = [
+            (key, value)
+            for key, value in ijson.kvitems(BytesIO(line), "message.usage")
+            if key in totals
+        ]
+    except (ijson.JSONError, UnicodeDecodeError):
+        return
+    for key, value in found:
+        totals[key] += value
+
+
+def _accumulate_tail(tail: bytes, totals: dict) -> bool:
+    """
+    Count a final line that has no trailing newline yet.
+
+    Returns True only if it is complete JSON — a half-written line is left
+    for the next Stop event to pick up once the rest of it has landed.
+    """
+    try:
+        obj = _loads(tail)
+    except (_JSONDecodeError, UnicodeDecodeError):
+        return False
+    _add_usage(obj, totals)
+    return True
+
+
+def _accumulate_mapped(path: Path, totals: dict, start: int = 0) -> int:
+    """
+    Feed each line of a memory-mapped transcript to _accumulate_usage().
+
+    Newlines are located with mmap.find() in C, so only the line slices
+    themselves are copied into Python — no file-object read buffering.
+    Returns the offset just past the last line consumed.
     """
-    code_file = Path(cwd) / ".claude" / "project-code.txt"
-    if code_file.exists():
-        code = code_file.read_text(encoding="utf-8").strip()
-        if code:
-            return code
-    return Path(cwd).name
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return start  # Empty file — nothing to map
+    finally:
+        os.close(fd)
+
+    try:
+        size = len(mm)
+        while start < size:
+            nl = mm.find(b"\n", start)
+            if nl < 0:
+                if _accumulate_tail(mm[start:size], totals):
+                    start = size
+                break
+            _accumulate_usage(mm[start:nl + 1], totals)
+            start = nl + 1
+    finally:
+        mm.close()
+    return start
+
+
+def _load_state() -> dict:
+    """Load per-session transcript offsets; missing or corrupt state means start over."""
+    try:
+        state = _loads(STATE_FILE.read_bytes())
+    except (OSError, _JSONDecodeError, UnicodeDecodeError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_state(state: dict) -> None:
+    """Atomically write the transcript state, keeping only the newest sessions."""
+    while len(state) > _STATE_MAX_SESSIONS:
+        del state[next(iter(state))]
+    tmp = STATE_FILE.with_name(f"{STATE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, STATE_FILE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
 
 
-def read_usage_from_transcript(transcript_path: str) -> dict:
+def read_usage_from_transcript(transcript_path: str, session_id: str = "") -> dict:
     """
     Parse the session transcript JSONL and sum token usage across all messages.
 
     Each assistant message in the transcript has a `message.usage` dict with:
       input_tokens, output_tokens, cache_creation_input_tokens, cache_read_input_tokens
 
+    Transcripts are append-only, so when a session_id is given the byte
+    offset and totals reached are remembered in STATE_FILE and the next Stop
+    event for that session only parses the newly appended tail. A transcript
+    that shrank or moved is re-read from the start.
+
     Returns a dict with the summed totals.
     """
     totals = {
@@ -80,95 +238,153 @@ def read_usage_from_transcript(transcript_path: str) -> dict:
     }
 
     path = Path(transcript_path)
-    if not path.exists():
+    try:
+        size = path.stat().st_size
+    except OSError:
         return totals
 
+    state = _load_state() if session_id else {}
+    start = 0
+    cached = state.pop(session_id, None)
+    # The state file is ours but hand-editable; anything malformed is
+    # ignored and the transcript re-read from the start
+    if (
+        isinstance(cached, dict)
+        and cached.get("transcript_path") == transcript_path
+        and type(cached.get("offset")) is int
+        and 0 <= cached["offset"] <= size
+        and isinstance(cached.get("totals"), dict)
+        and all(type(cached["totals"].get(key, 0)) is int for key in totals)
+    ):
+        start = cached["offset"]
+        for key in totals:
+            totals[key] = cached["totals"].get(key, 0)
+
     try:
-        with path.open(encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                msg = obj.get("message", {})
-                if not isinstance(msg, dict):
-                    continue
-                usage = msg.get("usage", {})
-                if not usage:
-                    continue
-                totals["input_tokens"] += usage.get("input_tokens", 0)
-                totals["output_tokens"] += usage.get("output_tokens", 0)
-                totals["cache_creation_input_tokens"] += usage.get(
-                    "cache_creation_input_tokens", 0
-                )
-                totals["cache_read_input_tokens"] += usage.get(
-                    "cache_read_input_tokens", 0
-                )
-    except (OSError, UnicodeDecodeError):
-        pass
+        end = _accumulate_mapped(path, totals, start)
+    except OSError:
+        return totals
+
+    if session_id:
+        # Re-inserted last so the newest sessions survive trimming
+        state[session_id] = {
+            "transcript_path": transcript_path,
+            "offset": end,
+            "totals": totals,
+        }
+        _save_state(state)
 
     return totals
 
 
+def append_row(row: tuple) -> None:
+    """
+    Append one row (in FIELDNAMES order) to sessions.csv with a single write.
+
+    The header is prepended when the file is new. O_APPEND makes the write
+    land atomically at end-of-file on POSIX; on Windows a byte-range lock
+    serializes hooks firing at the same time.
+    """
+    buf = StringIO()
+    csv.writer(buf).writerow(row)
+
+    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    fd = os.open(LOG_FILE, flags, 0o644)
+    try:
+        if msvcrt is not None:
+            os.lseek(fd, _LOCK_OFFSET, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            # Field names need no quoting; match csv.writer's "\r\n" terminator
+            header = "" if os.fstat(fd).st_size else ",".join(FIELDNAMES) + "\r\n"
+            os.write(fd, (header + buf.getvalue()).encode("utf-8"))
+        finally:
+            if msvcrt is not None:
+                os.lseek(fd, _LOCK_OFFSET, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
 def update_project_registry(project_code: str, cwd: str) -> None:
     """
     Upsert the project into projects.json so report.py can find billing.json
     files for all known projects, even those with no sessions in a given month.
-    """
-    try:
-        registry: dict = {}
-        if REGISTRY_FILE.exists():
-            registry = json.loads(REGISTRY_FILE.read_text(encoding="utf-8"))
 
-        now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        registry[project_code] = {"cwd": cwd, "last_seen": now_str}
+    The registry holds one JSON record per line ({"CODE": {...}}), so an
+    update copies the other lines through untouched, appends the new record,
+    and swaps the file in atomically — nothing is re-encoded. A legacy
+    pretty-printed registry is migrated to this layout on first update.
+    """
+    now_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    record = json.dumps(
+        {project_code: {"cwd": cwd, "last_seen": now_str}}, ensure_ascii=False
+    ) + "\n"
+    prefix = "{" + json.dumps(project_code, ensure_ascii=False) + ":"
+    tmp = REGISTRY_FILE.with_name(f"{REGISTRY_FILE.name}.{os.getpid()}.tmp")
 
-        REGISTRY_FILE.write_text(
-            json.dumps(registry, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
+    try:
+        with tmp.open("w", encoding="utf-8") as out:
+            try:
+                with REGISTRY_FILE.open(encoding="utf-8") as f:
+                    first = f.readline()
+                    if first.strip() == "{":
+                        legacy = json.loads(first + f.read())
+                        legacy.pop(project_code, None)
+                        for code, info in legacy.items():
+                            out.write(json.dumps({code: info}, ensure_ascii=False) + "\n")
+                    else:
+                        for line in itertools.chain((first,), f):
+                            if not line.strip() or line.startswith(prefix):
+                                continue
+                            out.write(line if line.endswith("\n") else line + "\n")
+            except FileNotFoundError:
+                pass
+            out.write(record)
+        os.replace(tmp, REGISTRY_FILE)
     except Exception:
         pass  # Never let registry failure break session logging
+    finally:
+        tmp.unlink(missing_ok=True)
 
 
-def main() -> None:
-    try:
-        payload = json.load(sys.stdin)
-    except (json.JSONDecodeError, ValueError):
-        payload = {}
-
+def log_session(payload: dict) -> None:
+    """Record one Stop event: sum transcript usage, append the row, refresh registry and dashboard."""
     cwd = payload.get("cwd", os.getcwd())
     now = datetime.now(timezone.utc)
 
     # Read token usage from the transcript file
     transcript_path = payload.get("transcript_path", "")
-    usage = read_usage_from_transcript(transcript_path) if transcript_path else {}
-
-    row = {
-        "date": now.strftime("%Y-%m-%d"),
-        "time_utc": now.strftime("%H:%M:%S"),
-        "project_code": get_project_code(cwd),
-        "cwd": cwd,
-        "session_id": payload.get("session_id", ""),
-        "input_tokens": usage.get("input_tokens", 0),
-        "output_tokens": usage.get("output_tokens", 0),
-        "cache_creation_tokens": usage.get("cache_creation_input_tokens", 0),
-        "cache_read_tokens": usage.get("cache_read_input_tokens", 0),
-    }
-
-    write_header = not LOG_FILE.exists()
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-    with LOG_FILE.open("a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(row)
+    usage = (
+        read_usage_from_transcript(transcript_path, payload.get("session_id", ""))
+        if transcript_path
+        else {}
+    )
+
+    project_code = get_project_code(cwd)
+    row = (  # FIELDNAMES order
+        now.strftime("%Y-%m-%d"),
+        now.strftime("%H:%M:%S"),
+        project_code,
+        cwd,
+        payload.get("session_id", ""),
+        usage.get("input_tokens", 0),
+        usage.get("output_tokens", 0),
+        usage.get("cache_creation_input_tokens", 0),
+        usage.get("cache_read_input_tokens", 0),
+    )
+
+    append_row(row)
+
+    # Keep the month's rollup current so reports on closed months skip the CSV
+    try:
+        from report import update_rollup
+        update_rollup(row[0][:7])
+    except Exception:
+        pass  # Rollups are an optimization; report.py rebuilds a missing one
 
-    update_project_registry(row["project_code"], cwd)
+    update_project_registry(project_code, cwd)
 
     # Update the README dashboard and push to GitHub
     try:
@@ -178,5 +394,90 @@ def main() -> None:
         pass  # Dashboard update must never break session logging
 
 
+def _log_failure(payload: dict) -> None:
+    """Write the exception being handled, tagged with its session, to stderr."""
+    sys.stderr.write(
+        f"{datetime.now(timezone.utc).isoformat()} "
+        f"session {payload.get('session_id', '?')} failed:\n"
+    )
+    traceback.print_exc()
+    sys.stderr.flush()
+
+
+def detach(payload: dict) -> bool:
+    """
+    Hand the payload to a background worker so the hook can return at once.
+
+    Returns True if a worker took over, False if detaching failed and the
+    caller should do the work inline.
+    """
+    if hasattr(os, "fork"):
+        try:
+            pid = os.fork()
+        except OSError:
+            return False
+        if pid:
+            return True
+
+        # Child: leave the hook's session and let go of its stdio pipes;
+        # stderr goes to ERROR_LOG so a lost row leaves a trace
+        try:
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            os.dup2(devnull, 0)
+            os.dup2(devnull, 1)
+            try:
+                err = os.open(ERROR_LOG, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            except OSError:
+                err = devnull
+            os.dup2(err, 2)
+            log_session(payload)
+        except BaseException:
+            _log_failure(payload)
+        finally:
+            os._exit(0)
+
+    try:
+        err_log = ERROR_LOG.open("ab")
+    except OSError:
+        err_log = None
+    try:
+        worker = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--worker"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=err_log or subprocess.DEVNULL,
+            creationflags=getattr(subprocess, "DETACHED_PROCESS", 0)
+            | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+        )
+        worker.stdin.write(json.dumps(payload).encode("utf-8"))
+        worker.stdin.close()
+    except OSError:
+        return False
+    finally:
+        if err_log is not None:
+            err_log.close()
+    return True
+
+
+def main() -> None:
+    try:
+        payload = json.load(sys.stdin)
+    except (json.JSONDecodeError, ValueError):
+        payload = {}
+
+    if "--worker" in sys.argv[1:]:
+        try:
+            log_session(payload)
+        except Exception:
+            _log_failure(payload)  # stderr is ERROR_LOG (see detach)
+        return
+
+    # Resolve the session directory now; the worker may not share our cwd
+    payload.setdefault("cwd", os.getcwd())
+    if not detach(payload):
+        log_session(payload)
+
+
 if __name__ == "__main__":
     main()
@@ -2,15 +2,20 @@
 Claude usage report — groups sessions.csv by project for monthly invoicing.
 
 Usage:
-  python report.py                  # current month
-  python report.py --month 2026-02  # specific month (YYYY-MM)
-  python report.py --all            # all time (expenses skipped)
+  python report.py                           # current month
+  python report.py --month 2026-02           # specific month (YYYY-MM)
+  python report.py --months 2026-01,2026-02  # several months combined (expenses skipped)
+  python report.py --all                     # all time (expenses skipped)
 
 Output is a plain-text summary suitable for copying into an invoice.
 Merges token usage (from sessions.csv) with project expenses (from each
 project's .claude/billing.json, discovered via projects.json registry).
 
-Sessions are logged automatically by log_session.py (the Claude Code Stop hook).
+Sessions are logged automatically by log_session.py (the Claude Code Stop hook),
+which also keeps per-month rollups (rollups/YYYY-MM.json) current so reports
+on closed months don't rescan the whole CSV. A rollup is rebuilt when
+sessions.csv shrinks, but hand-editing rows of a past month in place is not
+detected — delete rollups/ (or that month's file) after doing so.
 For API-billed projects, cross-reference the Anthropic Console filtered by API key
 for exact USD costs. For MAX subscription sessions, use session count x your rate.
 """
@@ -18,83 +23,370 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
+import io
 import json
-from collections import defaultdict
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Iterable, Iterator
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _loads = json.loads
 
 LOG_FILE = Path("C:/Users/Tracy/Projects/claude-tracking/sessions.csv")
 REGISTRY_FILE = Path("C:/Users/Tracy/Projects/claude-tracking/projects.json")
+ROLLUP_DIR = Path("C:/Users/Tracy/Projects/claude-tracking/rollups")
+
+# pandas is only worth importing (~0.3 s) for a CSV at least this large;
+# below it the csv path in _iter_rows() is faster end to end.
+_PANDAS_MIN_BYTES = 64 * 1024 * 1024
 
 _SEP = "-" * 70
 
+_MONTH_RE = re.compile(r"\d{4}-\d{2}")
+
+_TOKEN_COLUMNS = [
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_tokens",
+    "cache_read_tokens",
+]
+
+# Row layout yielded by load_sessions() when pandas isn't available
+_SUMMARY_COLUMNS = ["project_code", *_TOKEN_COLUMNS]
+
+# Per-project keys returned by summarize()
+_SUMMARY_KEYS = ["sessions", *_TOKEN_COLUMNS]
+
+
+def _pandas():
+    """Import pandas on first use. Returns None if it isn't installed."""
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
+
 
 # ---------------------------------------------------------------------------
-# Session loading (unchanged)
+# Session loading
 # ---------------------------------------------------------------------------
 
-def load_sessions(month: str | None) -> list[dict]:
-    """Load sessions from CSV, optionally filtered to a YYYY-MM month."""
-    if not LOG_FILE.exists():
+def load_sessions(months: Collection[str] | None) -> Iterable[tuple[str, ...]] | pd.DataFrame:
+    """
+    Load sessions from CSV, optionally filtered to a set of YYYY-MM months.
+
+    For a CSV of _PANDAS_MIN_BYTES or more, and with pandas installed, this
+    returns a DataFrame of just the columns summarize() needs; otherwise a
+    one-shot iterator of tuples laid out as _SUMMARY_COLUMNS. Either form can
+    be passed straight to summarize().
+    """
+    try:
+        size = LOG_FILE.stat().st_size
+    except OSError:
         return []
 
-    with LOG_FILE.open(newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
+    pd = _pandas() if size >= _PANDAS_MIN_BYTES else None
+    if pd is not None:
+        try:
+            df = pd.read_csv(
+                LOG_FILE,
+                usecols=["date", "project_code", *_TOKEN_COLUMNS],
+                dtype={"date": str, "project_code": str},
+                keep_default_na=False,
+                na_values={col: [""] for col in _TOKEN_COLUMNS},
+            )
+        except ValueError:
+            pass  # Missing columns — let the csv path cope
+        else:
+            if months is not None:
+                df = df[df["date"].str[:7].isin(months)]
+            return df
+
+    return _iter_rows(months)
 
-    if month:
-        rows = [r for r in rows if r["date"].startswith(month)]
 
-    return rows
+def _iter_rows(
+    months: Collection[str] | None, start: int = 0, end: int | None = None
+) -> Iterator[tuple[str, ...]]:
+    """
+    Stream (project_code, *_TOKEN_COLUMNS) tuples for rows in the given months.
 
+    Columns are located once from the header and picked out by position,
+    so no per-row dict is built. Columns missing from the header read as "".
+    Since date is the first column, other months' lines are dropped with a
+    set lookup on their raw first 7 bytes before they are decoded or
+    CSV-parsed.
 
-def summarize(sessions: list[dict]) -> dict[str, dict]:
+    start/end restrict the scan to a byte range of the file (the header is
+    always read from the top); both must fall on row boundaries.
+    """
+    with LOG_FILE.open("rb") as f:
+        header = next(csv.reader([f.readline().decode("utf-8")]), [])
+        src = f
+        if start > f.tell():
+            f.seek(start)
+        if end is not None:
+            src = io.BytesIO(f.read(max(0, end - f.tell())))
+
+        width = len(header)
+        position = {name: i for i, name in enumerate(header)}
+        date_idx = position.get("date", width)
+        indices = [position.get(name, width) for name in _SUMMARY_COLUMNS]
+        last = max(date_idx, *indices)
+        pick = itemgetter(*indices)
+
+        if months is not None:
+            months = frozenset(months)
+        if months is not None and date_idx == 0:
+            wanted = frozenset(m.encode("utf-8") for m in months)
+            lines = (line.decode("utf-8") for line in src if line[:7] in wanted)
+            months = None  # Already filtered
+        else:
+            lines = io.TextIOWrapper(src, encoding="utf-8", newline="")
+
+        for row in csv.reader(lines):
+            if not row:
+                continue
+            if len(row) <= last:
+                row += [""] * (last + 1 - len(row))
+            if months is not None and row[date_idx][:7] not in months:
+                continue
+            yield pick(row)
+
+
+def _summarize_frame(df: pd.DataFrame) -> dict[str, dict]:
+    """Vectorized summarize() for a DataFrame from load_sessions()."""
+    codes = df["project_code"].mask(df["project_code"] == "", "UNKNOWN")
+    grouped = df[_TOKEN_COLUMNS].fillna(0).astype("int64").groupby(codes, sort=False)
+    sums = grouped.sum()
+    sums.insert(0, "sessions", grouped.size())
+    return {
+        code: {key: int(value) for key, value in t.items()}
+        for code, t in sums.to_dict("index").items()
+    }
+
+
+def summarize(sessions: Iterable[tuple[str, ...]] | pd.DataFrame) -> dict[str, dict]:
     """
     Aggregate sessions by project code.
 
     Returns:
         {project_code: {sessions, input_tokens, output_tokens, cache_creation, cache_read}}
     """
-    totals: dict[str, dict] = defaultdict(lambda: {
-        "sessions": 0,
-        "input_tokens": 0,
-        "output_tokens": 0,
-        "cache_creation_tokens": 0,
-        "cache_read_tokens": 0,
-    })
-
-    for row in sessions:
-        code = row["project_code"] or "UNKNOWN"
-        t = totals[code]
-        t["sessions"] += 1
-        t["input_tokens"] += int(row.get("input_tokens") or 0)
-        t["output_tokens"] += int(row.get("output_tokens") or 0)
-        t["cache_creation_tokens"] += int(row.get("cache_creation_tokens") or 0)
-        t["cache_read_tokens"] += int(row.get("cache_read_tokens") or 0)
-
-    return dict(totals)
+    # Only load_sessions() imports pandas, so if it isn't loaded yet this
+    # can't be a DataFrame — and the check mustn't pay for the import.
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(sessions, pd.DataFrame):
+        return _summarize_frame(sessions)
+
+    # Positional accumulators: [sessions, input, output, cache_creation, cache_read]
+    totals: dict[str, list[int]] = {}
+
+    for code, inp, out, cache_creation, cache_read in sessions:
+        code = code or "UNKNOWN"
+        t = totals.get(code)
+        if t is None:
+            t = totals[code] = [0, 0, 0, 0, 0]
+        t[0] += 1
+        # Missing columns arrive as "" (never None), so test before int()
+        if inp:
+            t[1] += int(inp)
+        if out:
+            t[2] += int(out)
+        if cache_creation:
+            t[3] += int(cache_creation)
+        if cache_read:
+            t[4] += int(cache_read)
+
+    return {code: dict(zip(_SUMMARY_KEYS, t)) for code, t in totals.items()}
+
+
+def file_signature(path: Path) -> tuple[int, int] | None:
+    """(st_mtime_ns, st_size) of path, or None if it can't be stat'ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def summarize_months(months: frozenset[str] | None) -> dict[str, dict]:
+    """
+    summarize(load_sessions(months)), memoized per process.
+
+    The cache key includes the signature of sessions.csv, so an appended
+    session invalidates it. The returned dict is shared between callers
+    and must be treated as read-only.
+    """
+    return _summarize_months(LOG_FILE, file_signature(LOG_FILE), months)
+
+
+@functools.lru_cache(maxsize=8)
+def _summarize_months(
+    log_file: Path, sig: tuple[int, int] | None, months: frozenset[str] | None
+) -> dict[str, dict]:
+    return summarize(load_sessions(months))
+
+
+# ---------------------------------------------------------------------------
+# Monthly rollups
+# ---------------------------------------------------------------------------
+
+def load_rollup(month: str) -> dict | None:
+    """
+    Read rollups/<month>.json: {"log_size": bytes of sessions.csv covered,
+    "totals": summarize() output}. Returns None if missing or unreadable.
+    """
+    try:
+        rollup = json.loads((ROLLUP_DIR / f"{month}.json").read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(rollup, dict)
+        or type(rollup.get("log_size")) is not int
+        or not isinstance(rollup.get("totals"), dict)
+    ):
+        return None
+    return rollup
+
+
+def _merge_totals(into: dict[str, dict], extra: dict[str, dict]) -> None:
+    """Add one summarize() result into another, in place."""
+    for code, t in extra.items():
+        target = into.setdefault(code, dict.fromkeys(t, 0))
+        for key, value in t.items():
+            target[key] += value
+
+
+def update_rollup(month: str) -> dict[str, dict]:
+    """
+    Bring the month's rollup up to date with sessions.csv and return its totals.
+
+    The rollup records how many bytes of sessions.csv it covers, so an update
+    only scans the rows appended since — and hooks racing each other can never
+    count a row twice. A missing, unreadable, or too-new rollup is rebuilt from
+    a full scan of the file.
+    """
+    try:
+        size = LOG_FILE.stat().st_size
+    except OSError:
+        return {}
+
+    rollup = load_rollup(month)
+    if rollup is None or not 0 < rollup["log_size"] <= size:
+        totals = summarize(_iter_rows({month}, end=size))
+    else:
+        totals = rollup["totals"]
+        if rollup["log_size"] < size:
+            _merge_totals(totals, summarize(_iter_rows({month}, rollup["log_size"], size)))
+
+    ROLLUP_DIR.mkdir(parents=True, exist_ok=True)
+    path = ROLLUP_DIR / f"{month}.json"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps({"log_size": size, "totals": totals}, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+    return totals
+
+
+def load_month_totals(month: str) -> dict[str, dict]:
+    """
+    Summarize one YYYY-MM month.
+
+    Closed months are served from their rollup (written on first request)
+    while it still covers exactly the current sessions.csv. If the CSV grew,
+    only the appended bytes are scanned; if it shrank (truncated or reset),
+    the rollup is rebuilt. The current month is scanned from the CSV.
+    """
+    current = datetime.now(timezone.utc).strftime("%Y-%m")
+    if _MONTH_RE.fullmatch(month) and month < current:
+        rollup = load_rollup(month)
+        try:
+            size = LOG_FILE.stat().st_size
+        except OSError:
+            return {}
+        if rollup is not None and rollup["log_size"] == size:
+            return rollup["totals"]
+        try:
+            return update_rollup(month)
+        except OSError:
+            pass  # Read-only checkout etc. — just scan
+    return summarize(load_sessions({month}))
 
 
 # ---------------------------------------------------------------------------
 # Project registry & expense loading
 # ---------------------------------------------------------------------------
 
+def parse_registry(data: bytes) -> dict[str, dict]:
+    """
+    Parse the raw bytes of projects.json, which holds one {"CODE": {...}}
+    record per line.
+
+    A legacy registry written as a single pretty-printed object is still
+    accepted. Malformed record lines are skipped.
+    """
+    lines = data.splitlines()
+    if lines and lines[0].strip() == b"{":
+        return _loads(data)
+
+    registry: dict[str, dict] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            registry.update(_loads(line))
+        except (TypeError, ValueError):
+            continue
+    return registry
+
+
 def load_project_registry() -> dict[str, dict]:
     """
     Load the project registry mapping project codes to their working directories.
 
     Falls back to scanning sessions.csv for unique (project_code, cwd) pairs
     if projects.json does not exist yet.
+
+    Memoized per process on the signatures of both files; the returned
+    dict is shared between callers and must be treated as read-only.
     """
-    if REGISTRY_FILE.exists():
+    return _load_project_registry(
+        REGISTRY_FILE, file_signature(REGISTRY_FILE), LOG_FILE, file_signature(LOG_FILE)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_project_registry(
+    registry_file: Path,
+    registry_sig: tuple[int, int] | None,
+    log_file: Path,
+    log_sig: tuple[int, int] | None,
+) -> dict[str, dict]:
+    if registry_sig is not None:
         try:
-            return json.loads(REGISTRY_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            return parse_registry(registry_file.read_bytes())
+        except (ValueError, OSError):
             pass
 
     # Fallback: build registry from sessions.csv
     registry: dict[str, dict] = {}
-    if LOG_FILE.exists():
-        with LOG_FILE.open(newline="", encoding="utf-8") as f:
+    if log_sig is not None:
+        with log_file.open(newline="", encoding="utf-8") as f:
             for row in csv.DictReader(f):
                 code = row.get("project_code", "")
                 cwd = row.get("cwd", "")
@@ -105,16 +397,32 @@ def load_project_registry() -> dict[str, dict]:
 
 def load_billing(cwd: str) -> dict | None:
     """Read .claude/billing.json from a project directory. Returns None if missing."""
-    billing_file = Path(cwd) / ".claude" / "billing.json"
-    if not billing_file.exists():
-        return None
     try:
-        data = json.loads(billing_file.read_text(encoding="utf-8"))
-        if data.get("version") != 1:
-            return None
-        return data
+        data = json.loads((Path(cwd) / ".claude" / "billing.json").read_text(encoding="utf-8"))
     except (json.JSONDecodeError, OSError):
         return None
+    if not isinstance(data, dict) or data.get("version") != 1:
+        return None
+    return data
+
+
+def prefetch_billing(registry: dict[str, dict]) -> dict[str, dict]:
+    """
+    Load billing.json for every registered project at once.
+
+    The reads are independent small-file I/O, so a thread pool overlaps
+    them (a real win on OneDrive/network project folders). Returns
+    {project_code: billing} for projects that have a valid file.
+    """
+    codes = [code for code, info in registry.items() if info.get("cwd")]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = pool.map(load_billing, [registry[code]["cwd"] for code in codes])
+        return {code: billing for code, billing in zip(codes, results) if billing}
+
+
+def _ym_index(date: str) -> int:
+    """Map a "YYYY-MM..." string to a month count, for integer month arithmetic."""
+    return int(date[:4]) * 12 + int(date[5:7])
 
 
 def compute_month_expenses(billing: dict, month: str) -> list[dict]:
@@ -126,9 +434,8 @@ def compute_month_expenses(billing: dict, month: str) -> list[dict]:
 
     amount_due is the dollar amount due THIS month (0.0 if not due).
     """
-    month_start = datetime.strptime(month + "-01", "%Y-%m-%d")
-    month_year = month_start.year
-    month_num = month_start.month
+    current_month = _ym_index(month)
+    month_num = int(month[5:7])
 
     result = []
     for exp in billing.get("expenses", []):
@@ -156,17 +463,12 @@ def compute_month_expenses(billing: dict, month: str) -> list[dict]:
             end = exp.get("end_date")
 
             # Check if expense is active this month
-            if start:
-                start_dt = datetime.strptime(start[:7] + "-01", "%Y-%m-%d")
-                if month_start < start_dt:
-                    continue  # Not started yet
-            if end:
-                end_dt = datetime.strptime(end[:7] + "-01", "%Y-%m-%d")
-                if month_start > end_dt:
-                    continue  # Already ended
-
-            start_month = int(start[:4]) * 12 + int(start[5:7]) if start else 0
-            current_month = month_year * 12 + month_num
+            start_month = _ym_index(start) if start else 0
+            if start and current_month < start_month:
+                continue  # Not started yet
+            if end and current_month > _ym_index(end):
+                continue  # Already ended
+
             diff = current_month - start_month
 
             due_this_month = False
@@ -207,11 +509,13 @@ def compute_month_expenses(billing: dict, month: str) -> list[dict]:
 # Formatting helpers
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=4096)
 def fmt_tokens(n: int) -> str:
     """Format a token count with thousands separator."""
     return f"{n:,}"
 
 
+@functools.lru_cache(maxsize=4096)
 def fmt_usd(n: float) -> str:
     """Format a dollar amount."""
     return f"${n:,.2f}"
@@ -226,15 +530,26 @@ def print_report(
     period_label: str,
     registry: dict[str, dict] | None = None,
     month: str | None = None,
+    billing: dict[str, dict] | None = None,
 ) -> None:
-    """Print invoice-ready report to stdout."""
-    print()
-    print(f"Claude Usage Report  |  {period_label}")
-    print(_SEP)
+    """
+    Print invoice-ready report to stdout.
+
+    billing maps project codes to parsed billing.json (see prefetch_billing);
+    it is fetched here when omitted and expenses are being shown. The whole
+    report is assembled first and written with a single stdout write.
+    """
+    out: list[str] = []
+    emit = out.append
+
+    emit("")
+    emit(f"Claude Usage Report  |  {period_label}")
+    emit(_SEP)
 
     if not totals and not registry:
-        print("  No sessions recorded for this period.")
-        print(_SEP)
+        emit("  No sessions recorded for this period.")
+        emit(_SEP)
+        sys.stdout.write("\n".join(out) + "\n")
         return
 
     # Merge: ensure projects with expenses but no sessions still appear
@@ -242,83 +557,94 @@ def print_report(
     if registry and month:
         all_codes |= set(registry.keys())
 
+    if billing is None:
+        billing = prefetch_billing(registry) if registry and month else {}
+
     grand_expenses = 0.0
+    grand_sessions = grand_input = grand_output = 0
+
+    # Most sessions first; ties by code. Keys are built once, so the sort
+    # compares plain tuples rather than calling back into Python.
+    order = [(-totals[c]["sessions"] if c in totals else 0, c) for c in all_codes]
+    order.sort()
 
-    for code in sorted(all_codes, key=lambda c: -(totals.get(c, {}).get("sessions", 0))):
+    for _, code in order:
         t = totals.get(code)
 
         # Print token section if there are sessions
         if t:
+            # Every code in totals gets a row, so the grand totals are
+            # accumulated here instead of in separate passes afterwards
+            grand_sessions += t["sessions"]
+            grand_input += t["input_tokens"]
+            grand_output += t["output_tokens"]
             total_tokens = t["input_tokens"] + t["output_tokens"]
             cache_total = t["cache_creation_tokens"] + t["cache_read_tokens"]
-            print(
+            emit(
                 f"  {code:<24}  "
                 f"{t['sessions']:>3} session{'s' if t['sessions'] != 1 else ' '}  |  "
                 f"{fmt_tokens(t['input_tokens'])} input  |  "
                 f"{fmt_tokens(t['output_tokens'])} output  |  "
                 f"{fmt_tokens(cache_total)} cache"
             )
-            print(
+            emit(
                 f"  {'':24}  "
                 f"Total billable tokens: {fmt_tokens(total_tokens)}"
             )
         else:
-            print(f"  {code:<24}  (no sessions this period)")
+            emit(f"  {code:<24}  (no sessions this period)")
 
         # Print expenses if we have a month and registry
         if month and registry and code in registry:
-            cwd = registry[code].get("cwd", "")
-            billing = load_billing(cwd) if cwd else None
-            if billing:
-                expenses = compute_month_expenses(billing, month)
+            project_billing = billing.get(code)
+            if project_billing:
+                expenses = compute_month_expenses(project_billing, month)
                 if expenses:
-                    print()
-                    print(f"    Expenses:")
+                    emit("")
+                    emit(f"    Expenses:")
                     subtotal = 0.0
                     for exp in expenses:
                         amt_str = fmt_usd(exp["amount_due"]) if exp["amount_due"] > 0 else "--"
                         note = f"   {exp['note']}" if exp["note"] else ""
-                        print(
+                        emit(
                             f"      {exp['description']:<32} "
                             f"{exp['rate_label']:<12} "
                             f"{amt_str:>8}"
                             f"{note}"
                         )
                         subtotal += exp["amount_due"]
-                    print(f"      {'':32} {'':12} {'--------':>8}")
-                    print(f"      {'Expenses this month:':<44} {fmt_usd(subtotal):>8}")
+                    emit(f"      {'':32} {'':12} {'--------':>8}")
+                    emit(f"      {'Expenses this month:':<44} {fmt_usd(subtotal):>8}")
                     grand_expenses += subtotal
 
-        print()
+        emit("")
 
     # Grand totals
-    grand_sessions = sum(t["sessions"] for t in totals.values())
-    grand_input = sum(t["input_tokens"] for t in totals.values())
-    grand_output = sum(t["output_tokens"] for t in totals.values())
-    print(_SEP)
-    print(
+    emit(_SEP)
+    emit(
         f"  {'TOTAL':<24}  "
         f"{grand_sessions:>3} sessions  |  "
         f"{fmt_tokens(grand_input)} input  |  "
         f"{fmt_tokens(grand_output)} output"
     )
     if grand_expenses > 0:
-        print(f"  {'TOTAL EXPENSES':<24}  {fmt_usd(grand_expenses):>40}")
-    print(_SEP)
-    print()
-    print("Notes:")
-    print("  * Cache tokens (creation + read) are shown for reference.")
-    print("    Most billing models charge only for input + output tokens.")
-    print("  * For API-billed projects: cross-reference Anthropic Console")
-    print("    filtered by project API key for exact USD costs.")
-    print("  * For MAX subscription: use session count x your internal rate,")
-    print("    or bill a flat project fee.")
+        emit(f"  {'TOTAL EXPENSES':<24}  {fmt_usd(grand_expenses):>40}")
+    emit(_SEP)
+    emit("")
+    emit("Notes:")
+    emit("  * Cache tokens (creation + read) are shown for reference.")
+    emit("    Most billing models charge only for input + output tokens.")
+    emit("  * For API-billed projects: cross-reference Anthropic Console")
+    emit("    filtered by project API key for exact USD costs.")
+    emit("  * For MAX subscription: use session count x your internal rate,")
+    emit("    or bill a flat project fee.")
     if grand_expenses > 0:
-        print("  * Expense amounts reflect what is due THIS month only.")
-        print("    Yearly/quarterly items appear only in their renewal month.")
+        emit("  * Expense amounts reflect what is due THIS month only.")
+        emit("    Yearly/quarterly items appear only in their renewal month.")
     if not month:
-        print("  * Use --month YYYY-MM for expense details (skipped in --all mode).")
-    print()
+        emit("  * Use --month YYYY-MM for expense details (skipped in --all/--months).")
+    emit("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main() -> None:
@@ -331,6 +657,11 @@ def main() -> None:
         metavar="YYYY-MM",
         help="Report for a specific month (default: current month)",
     )
+    group.add_argument(
+        "--months",
+        metavar="YYYY-MM,...",
+        help="Combined report for a comma-separated list of months",
+    )
     group.add_argument(
         "--all",
         action="store_true",
@@ -341,19 +672,24 @@ def main() -> None:
     registry = load_project_registry()
 
     if args.all:
-        sessions = load_sessions(month=None)
+        totals = summarize(load_sessions(None))
         period_label = "All Time"
         month = None
+    elif args.months:
+        months = [m.strip() for m in args.months.split(",") if m.strip()]
+        totals = summarize(load_sessions(set(months)))
+        period_label = ", ".join(months)
+        month = None
     else:
         month = args.month or datetime.now(timezone.utc).strftime("%Y-%m")
-        sessions = load_sessions(month=month)
+        totals = load_month_totals(month)
         try:
             period_label = datetime.strptime(month, "%Y-%m").strftime("%b %Y")
         except ValueError:
             period_label = month
 
-    totals = summarize(sessions)
-    print_report(totals, period_label, registry=registry, month=month)
+    billing = prefetch_billing(registry) if month else {}
+    print_report(totals, period_label, registry=registry, month=month, billing=billing)
 
 
 if __name__ == "__main__":
@@ -7,6 +7,7 @@ Usage:
   python req_report.py --project ALD-SERVICETITAN   # one project
   python req_report.py --status proposed             # filter by status
   python req_report.py --detail                      # show individual REQ IDs
+  python req_report.py --no-cache                    # ignore requirements/.reqcache.json
 
 Discovers projects via projects.json (auto-maintained by log_session.py).
 Parses YAML frontmatter from each REQ-*.md file in requirements/.
@@ -15,14 +16,29 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+from report import parse_registry
+
 REGISTRY_FILE = Path("C:/Users/Tracy/Projects/claude-tracking/projects.json")
 
+# Per-project parse cache, written inside each requirements/ directory
+CACHE_NAME = ".reqcache.json"
+_CACHE_VERSION = 2
+
+# Cache misses are parsed on a thread pool once there are more than this many
+_PARALLEL_MIN_FILES = 8
+_PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 _SEP = "-" * 70
 
+# One "key: value" line of REQ frontmatter
+_FM_KV_RE = re.compile(r"^(\w+)\s*:\s*(.*)")
+
 # Status display order
 STATUS_ORDER = [
     "proposed",
@@ -36,40 +52,61 @@ STATUS_ORDER = [
 ]
 
 
+@dataclass(slots=True)
+class Req:
+    """One requirement, reduced to the frontmatter fields the report uses."""
+
+    id: str
+    status: str | None = None
+    title: str | None = None
+    priority: str | None = None
+    file: str = ""
+
+
 def load_project_registry() -> dict[str, dict]:
     """Load the project registry mapping project codes to working directories."""
     if REGISTRY_FILE.exists():
         try:
-            return json.loads(REGISTRY_FILE.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            return parse_registry(REGISTRY_FILE.read_bytes())
+        except (ValueError, OSError):
             pass
     return {}
 
 
-def parse_frontmatter(filepath: Path) -> dict | None:
+def parse_frontmatter(filepath: str) -> Req | None:
     """
     Parse YAML frontmatter from a markdown file.
 
     Reads the block between the first two '---' lines and extracts
     key: value pairs. Handles simple YAML (strings, dates, nulls, lists).
     Does not require PyYAML — uses regex for simplicity.
+
+    Only the frontmatter is read from disk; the markdown body after the
+    closing '---' is never loaded or decoded. Keys other than the Req
+    fields are ignored; a block without an id yields None.
     """
+    block: list[bytes] = []
     try:
-        text = filepath.read_text(encoding="utf-8")
+        with open(filepath, "rb") as f:
+            if f.readline().rstrip() != b"---":
+                return None
+            for raw in f:
+                if raw.rstrip() == b"---":
+                    break
+                block.append(raw)
+            else:
+                # No closing delimiter — not a frontmatter block
+                return None
+        text = b"".join(block).decode("utf-8")
     except (OSError, UnicodeDecodeError):
         return None
 
-    # Match frontmatter block
-    match = re.match(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
-    if not match:
-        return None
-
     frontmatter: dict = {}
-    for line in match.group(1).splitlines():
+    for line in text.splitlines():
         line = line.strip()
         if not line or line.startswith("#"):
             continue
-        m = re.match(r"^(\w+)\s*:\s*(.*)", line)
+        m = _FM_KV_RE.match(line)
         if m:
             key = m.group(1)
             val = m.group(2).strip()
@@ -88,30 +125,143 @@ def parse_frontmatter(filepath: Path) -> dict | None:
             else:
                 frontmatter[key] = val
 
-    return frontmatter if frontmatter.get("id") else None
+    if not frontmatter.get("id"):
+        return None
+    return Req(
+        id=frontmatter["id"],
+        status=frontmatter.get("status"),
+        title=frontmatter.get("title"),
+        priority=frontmatter.get("priority"),
+        file=os.path.basename(filepath),
+    )
+
+
+def _load_cache(req_dir: str) -> dict[str, dict]:
+    """
+    Read requirements/.reqcache.json; a missing or stale-format cache is empty.
+
+    Only the top-level shape is checked here — scan_requirements() validates
+    each entry and treats a malformed one as a miss.
+    """
+    try:
+        with open(os.path.join(req_dir, CACHE_NAME), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_cache(req_dir: str, files: dict[str, dict]) -> None:
+    """Atomically write the cache. A read-only project directory is not an error."""
+    path = os.path.join(req_dir, CACHE_NAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": _CACHE_VERSION, "files": files}, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
 
+def scan_requirements(
+    cwd: str, use_cache: bool = True
+) -> tuple[list[Req], dict[str, list[Req]]]:
+    """
+    Scan a project's requirements/ directory for REQ-*.md files.
 
-def scan_requirements(cwd: str) -> list[dict]:
-    """Scan a project's requirements/ directory for REQ-*.md files."""
-    req_dir = Path(cwd) / "requirements"
-    if not req_dir.is_dir():
-        return []
+    Returns the requirements in file-name order together with an index of
+    the same objects grouped by status (missing status -> "unknown"),
+    built in the same pass.
 
-    reqs = []
-    for f in sorted(req_dir.glob("REQ-*.md")):
-        fm = parse_frontmatter(f)
-        if fm:
-            fm["_file"] = f.name
-            reqs.append(fm)
-    return reqs
+    Parsed frontmatter is cached in requirements/.reqcache.json under each
+    file name together with its (mtime_ns, size) signature, so only files
+    that changed since the last run are read and parsed again.
+    """
+    # Plain path strings throughout: no Path object per file
+    req_dir = os.path.join(cwd, "requirements")
+    try:
+        with os.scandir(req_dir) as it:
+            entries = {
+                e.name: e
+                for e in it
+                if e.name.startswith("REQ-") and e.name.endswith(".md") and e.is_file()
+            }
+    except OSError:
+        # Missing, not a directory, unreadable, or an offline synced folder
+        return [], {}
+
+    cache = _load_cache(req_dir) if use_cache else {}
+    files: dict[str, dict] = {}
+    reqs: list[Req] = []
+    by_status: dict[str, list[Req]] = {}
+
+    names = []
+    stale = []
+    found: dict[str, Req | None] = {}
+    for name in sorted(entries):
+        try:
+            st = entries[name].stat()
+        except OSError:
+            continue  # Deleted or made unreadable since the listing
+        names.append(name)
+        sig = [st.st_mtime_ns, st.st_size]
+        cached = cache.get(name)
+        if (
+            isinstance(cached, dict)
+            and isinstance(cached.get("sig"), list)
+            and cached["sig"] == sig
+        ):
+            fm = cached.get("fm")
+            try:
+                found[name] = Req(**fm) if fm is not None else None
+            except TypeError:
+                pass  # Not a dict, or unknown/missing fields — re-parse
+            else:
+                files[name] = {"sig": sig, "fm": fm}
+                continue
+        files[name] = {"sig": sig, "fm": None}
+        stale.append(name)
+
+    # Small reads release the GIL, so a pool overlaps the disk latency;
+    # not worth starting one for a handful of files.
+    paths = [os.path.join(req_dir, name) for name in stale]
+    if len(stale) > _PARALLEL_MIN_FILES:
+        with ThreadPoolExecutor(max_workers=_PARSE_WORKERS) as pool:
+            parsed = list(pool.map(parse_frontmatter, paths))
+    else:
+        parsed = [parse_frontmatter(p) for p in paths]
+    for name, req in zip(stale, parsed):
+        files[name]["fm"] = asdict(req) if req else None
+        found[name] = req
+
+    for name in names:
+        req = found[name]
+        if req:
+            reqs.append(req)
+            by_status.setdefault(req.status or "unknown", []).append(req)
+
+    if use_cache and files != cache:
+        _save_cache(req_dir, files)
+    return reqs, by_status
 
 
 def print_report(
-    all_reqs: dict[str, list[dict]],
+    all_reqs: dict[str, tuple[list[Req], dict[str, list[Req]]]],
     status_filter: str | None = None,
     detail: bool = False,
 ) -> None:
-    """Print requirements status report to stdout."""
+    """
+    Print requirements status report to stdout.
+
+    all_reqs maps project code to the (reqs, by_status) pair returned by
+    scan_requirements.
+    """
     print()
     title = "Requirements Report"
     if status_filter:
@@ -127,47 +277,47 @@ def print_report(
         return
 
     grand_total = 0
+    project_count = 0
 
     for code in sorted(all_reqs.keys()):
-        reqs = all_reqs[code]
+        reqs, by_status = all_reqs[code]
         if status_filter:
-            reqs = [r for r in reqs if r.get("status") == status_filter]
-
-        if not reqs:
-            continue
+            items = by_status.get(status_filter)
+            if not items:
+                continue
+            by_status = {status_filter: items}
+            count = len(items)
+        else:
+            if not reqs:
+                continue
+            count = len(reqs)
 
         print(f"  {code}")
 
-        # Group by status
-        by_status: dict[str, list[dict]] = defaultdict(list)
-        for r in reqs:
-            by_status[r.get("status", "unknown")].append(r)
-
         for status in STATUS_ORDER:
             if status not in by_status:
                 continue
             items = by_status[status]
-            ids = ", ".join(r.get("id", "?") for r in items)
+            ids = ", ".join(r.id for r in items)
             if detail:
                 print(f"    {status:<14} {len(items):>3}   ({ids})")
                 for r in items:
-                    priority = r.get("priority", "")
-                    pri_tag = f" [{priority}]" if priority else ""
-                    print(f"{'':20} {r.get('id', '?')}: {r.get('title', 'untitled')}{pri_tag}")
+                    pri_tag = f" [{r.priority}]" if r.priority else ""
+                    print(f"{'':20} {r.id}: {r.title or 'untitled'}{pri_tag}")
             else:
                 print(f"    {status:<14} {len(items):>3}   ({ids})")
 
         # Unknown statuses
         for status, items in by_status.items():
             if status not in STATUS_ORDER:
-                ids = ", ".join(r.get("id", "?") for r in items)
+                ids = ", ".join(r.id for r in items)
                 print(f"    {status:<14} {len(items):>3}   ({ids})")
 
-        grand_total += len(reqs)
+        grand_total += count
+        project_count += 1
         print()
 
     print(_SEP)
-    project_count = sum(1 for reqs in all_reqs.values() if reqs)
     print(f"  TOTAL  {grand_total} requirements across {project_count} project{'s' if project_count != 1 else ''}")
     print(_SEP)
     print()
@@ -192,6 +342,11 @@ def main() -> None:
         action="store_true",
         help="Show individual requirement titles",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse every REQ file and leave requirements/.reqcache.json untouched",
+    )
     args = parser.parse_args()
 
     registry = load_project_registry()
@@ -203,12 +358,14 @@ def main() -> None:
             return
         registry = {args.project: registry[args.project]}
 
-    all_reqs: dict[str, list[dict]] = {}
+    all_reqs: dict[str, tuple[list[Req], dict[str, list[Req]]]] = {}
     for code, info in registry.items():
         cwd = info.get("cwd", "")
-        reqs = scan_requirements(cwd) if cwd else []
+        if not cwd:
+            continue
+        reqs, by_status = scan_requirements(cwd, use_cache=not args.no_cache)
         if reqs:
-            all_reqs[code] = reqs
+            all_reqs[code] = (reqs, by_status)
 
     print_report(all_reqs, status_filter=args.status, detail=args.detail)
 
@@ -2,22 +2,38 @@
 Auto-generate README.md spend dashboard and push to GitHub.
 
 Called at the end of every Claude Code session (from log_session.py).
-Regenerates the entire README.md from current data, commits, and pushes.
+Regenerates the entire README.md from current data, commits, and pushes
+(the push runs detached in the background).
+Does nothing when none of its inputs changed since the last run
+(tracked in .dashboard_stamp.json).
 All errors are caught and silently ignored — this must never block session exit.
 """
 from __future__ import annotations
 
+import functools
+import io
 import json
+import os
+import re
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Callable, Iterable
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _loads = json.loads
 
 # Reuse existing infrastructure from report.py
 from report import (
-    load_sessions,
-    summarize,
+    LOG_FILE,
+    REGISTRY_FILE,
+    file_signature,
+    summarize_months,
     load_project_registry,
-    load_billing,
+    prefetch_billing,
     compute_month_expenses,
     fmt_tokens,
     fmt_usd,
@@ -26,17 +42,47 @@ from report import (
 REPO_DIR = Path("C:/Users/Tracy/Projects/claude-tracking")
 README_PATH = REPO_DIR / "README.md"
 PRICING_PATH = REPO_DIR / "pricing.json"
+# Signature of the inputs the current README was generated from
+STAMP_PATH = REPO_DIR / ".dashboard_stamp.json"
+
+# README table templates (str.format)
+_USAGE_HEADER = (
+    "## Usage by Project\n\n"
+    "| Project | Sessions | Input | Output | Cache | Share | Allocated |\n"
+    "|---------|----------|-------|--------|-------|-------|-----------|\n"
+)
+_USAGE_ROW = "| {code} | {sessions} | {inp} | {out} | {cache} | {share:.0%} | {cost} |\n"
+_USAGE_ROW_EMPTY = "| {code} | 0 | -- | -- | -- | -- | -- |\n"
+_USAGE_ROW_TOTAL = (
+    "| **TOTAL** | **{sessions}** | **{inp}** | **{out}** | **{cache}** | "
+    "**100%** | **{cost}** |\n\n"
+)
+_EXPENSE_HEADER = (
+    "### {code}\n\n"
+    "| Expense | Rate | Due This Month |\n"
+    "|---------|------|----------------|\n"
+)
+_EXPENSE_ROW = "| {description}{note} | {rate} | {amount} |\n"
+_EXPENSE_SUBTOTAL = "| **Subtotal** | | **{amount}** |\n\n"
+
+# The only line that changes on every render; ignored when comparing READMEs
+_LAST_UPDATED_RE = re.compile(rb"Last updated: [^\n]*")
 
 
 def load_pricing() -> dict:
-    """Load pricing config from pricing.json."""
+    """Load pricing config from pricing.json (memoized on the file's signature)."""
+    return _load_pricing(PRICING_PATH, file_signature(PRICING_PATH))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_pricing(path: Path, sig: tuple[int, int] | None) -> dict:
     defaults = {
         "billing_model": "subscription",
         "monthly_cost": 100.0,
         "plan": "Claude Pro",
     }
     try:
-        data = json.loads(PRICING_PATH.read_text(encoding="utf-8"))
+        data = _loads(path.read_bytes())
         model = data.get("billing_model", "subscription")
         if model == "subscription":
             sub = data.get("subscription", {})
@@ -60,11 +106,116 @@ def total_tokens(t: dict) -> int:
     )
 
 
+def emit_project_table(
+    buf: io.StringIO,
+    totals: dict[str, dict],
+    codes: Iterable[str],
+    cost_fn: Callable[[dict, float], float],
+) -> None:
+    """
+    Write the "Usage by Project" table, most sessions first.
+
+    cost_fn(t, share) prices a row from its token totals and its share of
+    all tokens; the TOTAL row is priced from the grand totals with share 1.
+    Codes with no sessions get a placeholder row.
+    """
+    w = buf.write
+
+    # Grand totals in one pass; the token total is needed up front because
+    # each row's share is computed against it.
+    grand_sessions = grand_input = grand_output = grand_cache_write = grand_cache_read = 0
+    for t in totals.values():
+        grand_sessions += t["sessions"]
+        grand_input += t["input_tokens"]
+        grand_output += t["output_tokens"]
+        grand_cache_write += t["cache_creation_tokens"]
+        grand_cache_read += t["cache_read_tokens"]
+    grand = {
+        "sessions": grand_sessions,
+        "input_tokens": grand_input,
+        "output_tokens": grand_output,
+        "cache_creation_tokens": grand_cache_write,
+        "cache_read_tokens": grand_cache_read,
+    }
+    grand_cache = grand_cache_write + grand_cache_read
+    grand_total_tokens = grand_input + grand_output + grand_cache
+
+    w(_USAGE_HEADER)
+    row = _USAGE_ROW.format
+
+    # Most sessions first; ties break on project code
+    keyed = [(-(totals[c]["sessions"] if c in totals else 0), c) for c in codes]
+    keyed.sort()
+    for _, code in keyed:
+        t = totals.get(code)
+        if t:
+            proj_tokens = total_tokens(t)
+            share = proj_tokens / grand_total_tokens if grand_total_tokens > 0 else 0
+            w(row(
+                code=code,
+                sessions=t["sessions"],
+                inp=fmt_tokens(t["input_tokens"]),
+                out=fmt_tokens(t["output_tokens"]),
+                cache=fmt_tokens(t["cache_creation_tokens"] + t["cache_read_tokens"]),
+                share=share,
+                cost=fmt_usd(cost_fn(t, share)),
+            ))
+        else:
+            w(_USAGE_ROW_EMPTY.format(code=code))
+
+    w(_USAGE_ROW_TOTAL.format(
+        sessions=grand_sessions,
+        inp=fmt_tokens(grand_input),
+        out=fmt_tokens(grand_output),
+        cache=fmt_tokens(grand_cache),
+        cost=fmt_usd(cost_fn(grand, 1.0)),
+    ))
+
+
+def emit_expenses(
+    buf: io.StringIO, registry: dict[str, dict], codes: Iterable[str], month: str
+) -> float:
+    """
+    Write the "Project Expenses" section for codes, sorted by code.
+
+    The heading is only written if at least one project has expenses due
+    this month. Returns the sum of all project subtotals.
+    """
+    grand_expenses = 0.0
+    exp_buf = io.StringIO()
+    ew = exp_buf.write
+    billing_by_code = prefetch_billing(registry)
+    for code in sorted(codes):
+        billing = billing_by_code.get(code)
+        if not billing:
+            continue
+        expenses = compute_month_expenses(billing, month)
+        if not expenses:
+            continue
+        ew(_EXPENSE_HEADER.format(code=code))
+        subtotal = 0.0
+        for exp in expenses:
+            ew(_EXPENSE_ROW.format(
+                description=exp["description"],
+                note=f" {exp['note']}" if exp["note"] else "",
+                rate=exp["rate_label"],
+                amount=fmt_usd(exp["amount_due"]) if exp["amount_due"] > 0 else "--",
+            ))
+            subtotal += exp["amount_due"]
+        ew(_EXPENSE_SUBTOTAL.format(amount=fmt_usd(subtotal)))
+        grand_expenses += subtotal
+
+    expense_text = exp_buf.getvalue()
+    if expense_text:
+        buf.write("## Project Expenses\n\n")
+        buf.write(expense_text)
+    return grand_expenses
+
+
 def generate_readme(month: str) -> str:
     """Generate the complete README.md content for the current month."""
     now = datetime.now(timezone.utc)
-    sessions = load_sessions(month=month)
-    totals = summarize(sessions)
+    totals = summarize_months(frozenset({month}))
     registry = load_project_registry()
     pricing = load_pricing()
 
@@ -73,160 +224,152 @@ def generate_readme(month: str) -> str:
     except ValueError:
         period_label = month
 
-    lines: list[str] = []
-    lines.append("# Claude Code Spend Dashboard")
-    lines.append("")
-    lines.append(f"**{period_label}** | Last updated: {now.strftime('%Y-%m-%d %H:%M UTC')}")
-    lines.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Claude Code Spend Dashboard\n\n")
+    w(f"**{period_label}** | Last updated: {now.strftime('%Y-%m-%d %H:%M UTC')}\n\n")
 
     monthly_cost = pricing["monthly_cost"]
     plan_name = pricing["plan"]
 
-    lines.append(f"> **Plan:** {plan_name} ({fmt_usd(monthly_cost)}/mo)")
-    lines.append(">")
-    lines.append("> Subscription cost is allocated across projects by share of total token usage.")
-    lines.append("")
+    w(f"> **Plan:** {plan_name} ({fmt_usd(monthly_cost)}/mo)\n")
+    w(">\n")
+    w("> Subscription cost is allocated across projects by share of total token usage.\n\n")
 
     if not totals:
-        lines.append("_No sessions recorded this month._")
-        lines.append("")
-        return "\n".join(lines)
+        w("_No sessions recorded this month._\n")
+        return buf.getvalue()
 
-    # Calculate grand total tokens for proportional allocation
-    grand_total_tokens = sum(total_tokens(t) for t in totals.values())
-
-    # --- Per-project table ---
     all_codes = set(totals.keys())
     if registry:
         all_codes |= set(registry.keys())
 
-    lines.append("## Usage by Project")
-    lines.append("")
-    lines.append("| Project | Sessions | Input | Output | Cache | Share | Allocated |")
-    lines.append("|---------|----------|-------|--------|-------|-------|-----------|")
-
-    for code in sorted(all_codes, key=lambda c: -(totals.get(c, {}).get("sessions", 0))):
-        t = totals.get(code)
-        if t:
-            proj_tokens = total_tokens(t)
-            share = proj_tokens / grand_total_tokens if grand_total_tokens > 0 else 0
-            allocated = monthly_cost * share
-            cache_total = t["cache_creation_tokens"] + t["cache_read_tokens"]
-            lines.append(
-                f"| {code} | {t['sessions']} | "
-                f"{fmt_tokens(t['input_tokens'])} | "
-                f"{fmt_tokens(t['output_tokens'])} | "
-                f"{fmt_tokens(cache_total)} | "
-                f"{share:.0%} | "
-                f"{fmt_usd(allocated)} |"
-            )
-        else:
-            lines.append(f"| {code} | 0 | -- | -- | -- | -- | -- |")
-
-    # Grand total row
-    grand_sessions = sum(t["sessions"] for t in totals.values())
-    grand_input = sum(t["input_tokens"] for t in totals.values())
-    grand_output = sum(t["output_tokens"] for t in totals.values())
-    grand_cache = sum(
-        t["cache_creation_tokens"] + t["cache_read_tokens"] for t in totals.values()
-    )
-    lines.append(
-        f"| **TOTAL** | **{grand_sessions}** | "
-        f"**{fmt_tokens(grand_input)}** | "
-        f"**{fmt_tokens(grand_output)}** | "
-        f"**{fmt_tokens(grand_cache)}** | "
-        f"**100%** | "
-        f"**{fmt_usd(monthly_cost)}** |"
-    )
-    lines.append("")
+    # --- Per-project table (subscription cost allocated by token share) ---
+    emit_project_table(buf, totals, all_codes, lambda t, share: monthly_cost * share)
 
     # --- Expenses section ---
-    grand_expenses = 0.0
-    expense_lines: list[str] = []
-    for code in sorted(all_codes):
-        if code not in registry:
-            continue
-        cwd = registry[code].get("cwd", "")
-        billing = load_billing(cwd) if cwd else None
-        if not billing:
-            continue
-        expenses = compute_month_expenses(billing, month)
-        if not expenses:
-            continue
-        expense_lines.append(f"### {code}")
-        expense_lines.append("")
-        expense_lines.append("| Expense | Rate | Due This Month |")
-        expense_lines.append("|---------|------|----------------|")
-        subtotal = 0.0
-        for exp in expenses:
-            amt_str = fmt_usd(exp["amount_due"]) if exp["amount_due"] > 0 else "--"
-            note = f" {exp['note']}" if exp["note"] else ""
-            expense_lines.append(
-                f"| {exp['description']}{note} | {exp['rate_label']} | {amt_str} |"
-            )
-            subtotal += exp["amount_due"]
-        expense_lines.append(f"| **Subtotal** | | **{fmt_usd(subtotal)}** |")
-        expense_lines.append("")
-        grand_expenses += subtotal
-
-    if expense_lines:
-        lines.append("## Project Expenses")
-        lines.append("")
-        lines.extend(expense_lines)
+    grand_expenses = emit_expenses(buf, registry, all_codes, month)
 
     # --- Grand total ---
-    lines.append("## Monthly Total")
-    lines.append("")
-    lines.append("| Category | Amount |")
-    lines.append("|----------|--------|")
-    lines.append(f"| {plan_name} subscription | {fmt_usd(monthly_cost)} |")
+    w("## Monthly Total\n\n")
+    w("| Category | Amount |\n")
+    w("|----------|--------|\n")
+    w(f"| {plan_name} subscription | {fmt_usd(monthly_cost)} |\n")
     if grand_expenses > 0:
-        lines.append(f"| Project expenses | {fmt_usd(grand_expenses)} |")
-    lines.append(f"| **Total** | **{fmt_usd(monthly_cost + grand_expenses)}** |")
-    lines.append("")
+        w(f"| Project expenses | {fmt_usd(grand_expenses)} |\n")
+    w(f"| **Total** | **{fmt_usd(monthly_cost + grand_expenses)}** |\n\n")
 
     # --- Footer ---
-    lines.append("---")
-    lines.append("")
-    lines.append(
+    w("---\n\n")
+    w(
         "_Auto-generated by [claude-tracking](https://github.com/jrhoades1/claude-tracking). "
-        "Do not edit manually._"
+        "Do not edit manually._\n"
     )
-    lines.append("")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def git_commit_and_push() -> None:
-    """Stage README.md + data files, commit, and push. Silently ignores all failures."""
+    """
+    Stage README.md + data files and commit, then push in the background.
+
+    add/commit run synchronously so the repo is consistent when this
+    returns; the push is a detached process that outlives the hook, so
+    session exit never waits on the network. Silently ignores all failures.
+    """
     now = datetime.now(timezone.utc)
     msg = f"dashboard: {now.strftime('%Y-%m-%d %H:%M UTC')}"
 
+    # One shell (cmd.exe on Windows, sh elsewhere) runs add + commit, so
+    # session exit pays for a single process start. "git diff --cached
+    # --quiet" succeeds when nothing is staged, which short-circuits the
+    # commit and avoids empty commits.
+    script = (
+        "git add README.md sessions.csv projects.json && "
+        f'(git diff --cached --quiet || git commit -m "{msg}")'
+    )
     try:
-        run = lambda args: subprocess.run(
-            args, cwd=str(REPO_DIR), capture_output=True, timeout=30
+        result = subprocess.run(
+            script, shell=True, cwd=str(REPO_DIR), capture_output=True, timeout=30
+        )
+        if result.returncode != 0:
+            return
+
+        # Pushed even when nothing new was committed, which also retries
+        # commits whose earlier push failed (offline, auth, ...).
+        subprocess.Popen(
+            ["git", "push"],
+            cwd=str(REPO_DIR),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            creationflags=getattr(subprocess, "DETACHED_PROCESS", 0)
+            | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
         )
+    except (subprocess.TimeoutExpired, OSError):
+        pass  # Network issues, git not found, etc. — never block session exit
 
-        # Stage data files so the dashboard stays in sync with its data
-        run(["git", "add", "README.md", "sessions.csv", "projects.json"])
 
-        # Check if there are staged changes (avoid empty commits)
-        result = run(["git", "diff", "--cached", "--quiet"])
-        if result.returncode == 0:
-            return  # Nothing to commit
+def input_stamp(month: str) -> str:
+    """
+    Serialized signature of everything generate_readme(month) reads.
 
-        run(["git", "commit", "-m", msg])
-        run(["git", "push"])
-    except (subprocess.TimeoutExpired, OSError):
-        pass  # Network issues, git not found, etc. — never block session exit
+    Covers sessions.csv, projects.json, pricing.json and each registered
+    project's .claude/billing.json, plus the month itself.
+    """
+    registry = load_project_registry()
+    billing = {
+        code: file_signature(Path(registry[code]["cwd"]) / ".claude" / "billing.json")
+        for code in sorted(registry)
+        if registry[code].get("cwd")
+    }
+    return json.dumps(
+        {
+            "month": month,
+            "sessions": file_signature(LOG_FILE),
+            "registry": file_signature(REGISTRY_FILE),
+            "pricing": file_signature(PRICING_PATH),
+            "billing": billing,
+        },
+        sort_keys=True,
+    )
+
+
+def write_readme(content: str) -> bool:
+    """
+    Atomically replace README.md with content, unless the only difference
+    from the current file is the "Last updated" timestamp.
+
+    Returns True if the file was written.
+    """
+    new = content.encode("utf-8")
+    try:
+        old = README_PATH.read_bytes()
+    except FileNotFoundError:
+        old = b""
+    if _LAST_UPDATED_RE.sub(b"", new) == _LAST_UPDATED_RE.sub(b"", old):
+        return False
+
+    tmp = README_PATH.with_suffix(".md.tmp")
+    tmp.write_bytes(new)
+    os.replace(tmp, README_PATH)
+    return True
 
 
 def main() -> None:
-    """Entry point: regenerate README and push."""
+    """Entry point: regenerate README and push, unless no input has changed."""
     try:
         month = datetime.now(timezone.utc).strftime("%Y-%m")
-        content = generate_readme(month)
-        README_PATH.write_text(content, encoding="utf-8")
-        git_commit_and_push()
+        stamp = input_stamp(month)
+        try:
+            if STAMP_PATH.read_text(encoding="utf-8") == stamp:
+                return  # README already reflects this data
+        except OSError:
+            pass
+        changed = write_readme(generate_readme(month))
+        STAMP_PATH.write_text(stamp, encoding="utf-8")
+        if changed:
+            git_commit_and_push()
     except Exception:
         pass  # Absolute safety net — never crash, never block